@@ -22,9 +22,140 @@ Usage:
     print(response['answer'])  # Claude's response with original PHI restored
 """
 
+import asyncio
+import atexit
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+import weakref
 import anthropic
-from typing import Dict, Any, Optional, List
-from medscrub_client import MedScrubClient, MedScrubError
+import requests
+from collections import OrderedDict
+from typing import Dict, Any, Optional, List, Tuple, Iterator, Set
+from medscrub_client import MedScrubClient, MedScrubError, MedScrubNotFoundError
+
+logger = logging.getLogger(__name__)
+
+
+# Clients with undeleted sessions; one atexit hook covers all of them
+_live_clients: "weakref.WeakSet[MedScrubClaude]" = weakref.WeakSet()
+
+
+def _flush_at_exit() -> None:
+    """atexit hook: delete still-alive clients' sessions before the interpreter exits"""
+    for client in list(_live_clients):
+        try:
+            client.cleanup()
+        except Exception as e:
+            logger.warning("Could not delete MedScrub sessions at exit: %s", e)
+
+
+atexit.register(_flush_at_exit)
+
+
+DEFAULT_SYSTEM_PROMPT = """You are a helpful healthcare AI assistant. You are analyzing de-identified patient data where PHI has been replaced with tokens like [FHIR_NAME_abc123].
+
+Your responses will be automatically re-identified, so use the tokens exactly as shown when referring to patient information.
+
+Provide clear, accurate medical information based on the data provided."""
+
+# User prompt template pieces, joined around the (often large) de-identified resource
+_USER_PROMPT_PRE = "Here is the patient data:\n\n"
+_USER_PROMPT_MID = "\n\nQuestion: "
+_USER_PROMPT_POST = (
+    "\n\nPlease answer the question based on the data provided. "
+    "Use the exact tokens (e.g., [FHIR_NAME_xyz]) when referring to patient information."
+)
+_CHAT_CONTEXT_PRE = "Patient data:\n"
+
+# Max de-identified renderings kept for chat_about_fhir turns
+_CHAT_DEID_CACHE_SIZE = 32
+
+# Streamed text is re-identified in pieces of about this many characters (or per line)
+_STREAM_FLUSH_CHARS = 256
+
+# De-identification placeholder tokens, e.g. [FHIR_NAME_abc123] (compiled once)
+_PLACEHOLDER_RE = re.compile(r"\[FHIR_[A-Z_]+_[A-Za-z0-9]+\]")
+
+# Streamed tail that may still become a placeholder: a prefix of "[FHIR_" or an unclosed token
+_PARTIAL_PLACEHOLDER_RE = re.compile(r"\[(?:F(?:H(?:I(?:R(?:_[A-Za-z0-9_]*)?)?)?)?)?")
+
+# numba is optional: compiled byte-level placeholder scan for long responses
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this length the regex scan is cheaper than the numba call overhead
+_NUMBA_SCAN_MIN_CHARS = 4096
+
+if njit is not None:
+    @njit(cache=True)
+    def _scan_placeholder_bytes(buf):
+        """State machine equivalent of _PLACEHOLDER_RE over ASCII bytes"""
+        spans = []
+        prefix = (91, 70, 72, 73, 82, 95)  # "[FHIR_"
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            # State 0/1: look for "[" and verify the "FHIR_" prefix
+            if buf[i] != 91:
+                i += 1
+                continue
+            start = i
+            matched = 1
+            while matched < 6 and i + matched < n and buf[i + matched] == prefix[matched]:
+                matched += 1
+            if matched < 6:
+                i += 1
+                continue
+
+            # State 2: accept [A-Za-z0-9_] until "]"; the body must split at
+            # its last "_" into [A-Z_]+ and [A-Za-z0-9]+
+            j = i + 6
+            body_len = 0
+            all_upper = True
+            left_ok = False
+            right_len = 0
+            accepted = False
+            while j < n:
+                c = buf[j]
+                if c == 93:  # "]"
+                    accepted = left_ok and right_len > 0
+                    break
+                if c == 95:  # "_"
+                    left_ok = all_upper and body_len > 0
+                    right_len = 0
+                elif 65 <= c <= 90:
+                    right_len += 1
+                elif 97 <= c <= 122 or 48 <= c <= 57:
+                    all_upper = False
+                    right_len += 1
+                else:
+                    break
+                body_len += 1
+                j += 1
+
+            if accepted:
+                spans.append((start, j + 1))
+                i = j + 1
+            else:
+                i = start + 1
+        return spans
+else:
+    _scan_placeholder_bytes = None
+
+
+def _scan_placeholders(text: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of every placeholder token in text"""
+    if _scan_placeholder_bytes is not None and len(text) >= _NUMBA_SCAN_MIN_CHARS and text.isascii():
+        return _scan_placeholder_bytes(np.frombuffer(text.encode("ascii"), dtype=np.uint8))
+    return [match.span() for match in _PLACEHOLDER_RE.finditer(text)]
 
 
 class MedScrubClaude:
@@ -37,6 +168,7 @@ class MedScrubClaude:
     Attributes:
         medscrub: MedScrub client for PHI de-identification
         claude: Anthropic Claude API client
+        aclaude: Async Anthropic Claude API client (used by the a* methods)
     """
 
     def __init__(
@@ -45,7 +177,9 @@ class MedScrubClaude:
         medscrub_api_key: Optional[str] = None,
         claude_api_key: str = None,
         medscrub_api_url: str = "https://api.medscrub.dev",
-        claude_model: str = "claude-3-5-sonnet-20241022"
+        claude_model: str = "claude-3-5-sonnet-20241022",
+        use_fused_ask: bool = True,
+        max_idle_seconds: Optional[float] = None
     ):
         """
         Initialize integrated MedScrub + Claude client
@@ -56,6 +190,11 @@ class MedScrubClaude:
             claude_api_key: Anthropic API key (from console.anthropic.com)
             medscrub_api_url: MedScrub API URL (default: hosted)
             claude_model: Claude model to use (default: claude-3-5-sonnet-20241022)
+            use_fused_ask: Route ask_about_fhir through MedScrub's single-call
+                /api/fhir/ask endpoint when the server supports it (default: True)
+            max_idle_seconds: If set, delete this client's sessions and clear its
+                caches after this many seconds with no ask/chat call in
+                progress (default: None, never)
         """
         if not claude_api_key:
             raise ValueError("claude_api_key is required. Get one from console.anthropic.com")
@@ -67,12 +206,59 @@ class MedScrubClaude:
             api_url=medscrub_api_url
         )
 
-        # Initialize Claude client
+        # Initialize Claude client (the async client is created per event loop, see aclaude)
         self.claude = anthropic.Anthropic(api_key=claude_api_key)
+        self._claude_api_key = claude_api_key
+        self._aclaude: Optional[anthropic.AsyncAnthropic] = None
+        self._aclaude_loop: Optional[asyncio.AbstractEventLoop] = None
         self.model = claude_model
 
-        # Track session for automatic cleanup
+        # Guards session tracking, the chat cache and the idle timer (the timer runs on its own thread)
+        self._lock = threading.RLock()
+
+        # Track sessions for automatic cleanup
         self._current_session_id = None
+        self._pending_session_ids = set()
+
+        # Delete sessions after inactivity (counted from the end of the last call),
+        # and at interpreter exit as a last resort (see _flush_at_exit)
+        self.max_idle_seconds = max_idle_seconds
+        self._idle_timer: Optional[threading.Timer] = None
+        self._active_calls = 0
+
+        # (session_id, resource fingerprint) -> (deidentified_resource, session_id), LRU order
+        self._deid_cache: "OrderedDict[Tuple[Optional[str], bytes], Tuple[str, str]]" = OrderedDict()
+
+        # None until the server has been probed for the fused /api/fhir/ask endpoint
+        self._fused_ask_available: Optional[bool] = None if use_fused_ask else False
+
+    @property
+    def aclaude(self) -> anthropic.AsyncAnthropic:
+        """Async Claude client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._aclaude is None or self._aclaude_loop is not loop:
+            # Pooled connections can't outlive their loop (e.g. across asyncio.run calls)
+            self._aclaude = anthropic.AsyncAnthropic(api_key=self._claude_api_key)
+            self._aclaude_loop = loop
+        return self._aclaude
+
+    @staticmethod
+    def _system_blocks(system_prompt: Optional[str]) -> List[Dict[str, Any]]:
+        """System prompt as a content block marked for Anthropic prompt caching"""
+        return [{
+            "type": "text",
+            "text": system_prompt or DEFAULT_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }]
+
+    @staticmethod
+    def _build_user_prompt(deidentified_resource: str, question: str) -> str:
+        """Build the user turn sent to Claude for a single question"""
+        return "".join((
+            _USER_PROMPT_PRE, deidentified_resource,
+            _USER_PROMPT_MID, question,
+            _USER_PROMPT_POST
+        ))
 
     def ask_about_fhir(
         self,
@@ -92,6 +278,9 @@ class MedScrubClaude:
         3. Re-identifies Claude's response to restore original PHI
         4. Returns the answer with full context preserved
 
+        When the MedScrub server advertises the "fhir/ask" feature, steps 1-3
+        run server-side in a single call (see MedScrubClient.ask_llm).
+
         Args:
             resource: FHIR resource (Patient, Observation, etc.) or Bundle
             question: Question to ask Claude about the data
@@ -124,10 +313,23 @@ class MedScrubClaude:
             print(result['answer'])
             # "This patient has Type 2 Diabetes and was born on 1985-03-15."
         """
-        import time
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
+        self._begin_call()
         try:
+            # Fast path: one server round trip instead of three
+            if self._has_fused_ask():
+                try:
+                    return self._ask_fused(
+                        resource, question, session_id,
+                        max_tokens, temperature, system_prompt, t0
+                    )
+                except MedScrubNotFoundError:
+                    # A 404 for an expired session is the caller's error, not a missing route
+                    if session_id and not self._session_exists(session_id):
+                        raise
+                    self._fused_ask_available = False
+
             # Step 1: De-identify FHIR resource
             deidentify_result = self.medscrub.deidentify_fhir(
                 resource=resource,
@@ -136,49 +338,287 @@ class MedScrubClaude:
             )
 
             session_id = deidentify_result['sessionId']
-            self._current_session_id = session_id
+            self._track_session(session_id)
             deidentified_resource = deidentify_result['deidentifiedResource']
 
             # Step 2: Build prompt for Claude
-            default_system = """You are a helpful healthcare AI assistant. You are analyzing de-identified patient data where PHI has been replaced with tokens like [FHIR_NAME_abc123].
+            user_prompt = self._build_user_prompt(deidentified_resource, question)
 
-Your responses will be automatically re-identified, so use the tokens exactly as shown when referring to patient information.
+            # Step 3: Stream Claude's response
+            with self.claude.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=self._system_blocks(system_prompt),
+                messages=[{
+                    "role": "user",
+                    "content": user_prompt
+                }]
+            ) as stream:
+                deidentified_answer = "".join(stream.text_stream)
+                message = stream.get_final_message()
 
-Provide clear, accurate medical information based on the data provided."""
+            # Step 4: Re-identify Claude's response as soon as the stream closes
+            original_answer = self._reidentify_answer(deidentified_answer, session_id)
 
-            user_prompt = f"""Here is the patient data:
+            # Calculate total processing time
+            total_time = (time.perf_counter_ns() - t0) // 1_000_000
 
-{deidentified_resource}
+            return {
+                "answer": original_answer,
+                "deidentifiedAnswer": deidentified_answer,
+                "sessionId": session_id,
+                "usage": {
+                    "inputTokens": message.usage.input_tokens,
+                    "outputTokens": message.usage.output_tokens,
+                    "totalTokens": message.usage.input_tokens + message.usage.output_tokens
+                },
+                "processingTime": total_time,
+                "model": self.model
+            }
 
-Question: {question}
+        except MedScrubError as e:
+            raise Exception(f"MedScrub error: {e}")
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error: {e}")
+        finally:
+            self._end_call()
+
+    def _has_fused_ask(self) -> bool:
+        """Check whether the MedScrub server offers /api/fhir/ask (probed until one probe succeeds)"""
+        if self._fused_ask_available is None:
+            try:
+                features = self.medscrub.health_check().get("features", [])
+            except (MedScrubError, requests.RequestException, ValueError):
+                return False  # probe failed - try again on the next call
+            self._fused_ask_available = "fhir/ask" in features
+        return self._fused_ask_available
+
+    def _session_exists(self, session_id: str) -> bool:
+        """Check whether a MedScrub session is still alive"""
+        try:
+            self.medscrub.get_session_info(session_id)
+        except MedScrubNotFoundError:
+            return False
+        return True
 
-Please answer the question based on the data provided. Use the exact tokens (e.g., [FHIR_NAME_xyz]) when referring to patient information."""
+    def _ask_fused(
+        self,
+        resource: Dict[str, Any],
+        question: str,
+        session_id: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        system_prompt: Optional[str],
+        t0: int
+    ) -> Dict[str, Any]:
+        """Answer via MedScrub's fused endpoint, in the ask_about_fhir result format"""
+        result = self.medscrub.ask_llm(
+            resource=resource,
+            prompt=question,
+            model=self.model,
+            session_id=session_id,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT
+        )
 
-            # Step 3: Call Claude API
-            message = self.claude.messages.create(
+        self._track_session(result['sessionId'])
+        usage = result.get('usage', {})
+        input_tokens = usage.get('inputTokens', 0)
+        output_tokens = usage.get('outputTokens', 0)
+
+        return {
+            "answer": result['answer'],
+            "deidentifiedAnswer": result.get('deidentifiedAnswer'),
+            "sessionId": result['sessionId'],
+            "usage": {
+                "inputTokens": input_tokens,
+                "outputTokens": output_tokens,
+                "totalTokens": input_tokens + output_tokens
+            },
+            "processingTime": (time.perf_counter_ns() - t0) // 1_000_000,
+            "model": self.model
+        }
+
+    def ask_about_fhir_stream(
+        self,
+        resource: Dict[str, Any],
+        question: str,
+        session_id: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 1.0,
+        system_prompt: Optional[str] = None
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Stream Claude's answer about FHIR data, re-identifying as it arrives
+
+        Text is flushed only up to the last complete placeholder token, so a
+        token split across chunks is never sent for re-identification half
+        finished. Deltas are buffered until a newline or about
+        _STREAM_FLUSH_CHARS characters, so re-identification runs per line
+        rather than per delta. Chunks without placeholders are passed through
+        without a MedScrub call.
+
+        Args:
+            resource: FHIR resource (Patient, Observation, etc.) or Bundle
+            question: Question to ask Claude about the data
+            session_id: Optional session ID (creates new if not provided)
+            max_tokens: Maximum tokens in response (default: 1024)
+            temperature: Sampling temperature 0-1 (default: 1.0)
+            system_prompt: Optional system prompt for Claude
+
+        Yields:
+            (deidentified_delta, reidentified_delta) tuples
+
+        Example:
+            for _, text in client.ask_about_fhir_stream(patient, "Summarize this patient"):
+                print(text, end="", flush=True)
+        """
+        self._begin_call()
+        try:
+            deidentify_result = self.medscrub.deidentify_fhir(
+                resource=resource,
+                session_id=session_id,
+                output_format="llm-optimized"
+            )
+
+            session_id = deidentify_result['sessionId']
+            self._track_session(session_id)
+            user_prompt = self._build_user_prompt(
+                deidentify_result['deidentifiedResource'],
+                question
+            )
+
+            buf = ""
+            pending = ""
+            with self.claude.messages.stream(
                 model=self.model,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_prompt or default_system,
+                system=self._system_blocks(system_prompt),
                 messages=[{
                     "role": "user",
                     "content": user_prompt
                 }]
+            ) as stream:
+                for text in stream.text_stream:
+                    ready, buf = self._split_on_boundary(buf + text)
+                    pending += ready
+                    if pending and ("\n" in ready or len(pending) >= _STREAM_FLUSH_CHARS):
+                        yield pending, self._reidentify_answer(pending, session_id)
+                        pending = ""
+
+            pending += buf
+            if pending:
+                yield pending, self._reidentify_answer(pending, session_id)
+
+        except MedScrubError as e:
+            raise Exception(f"MedScrub error: {e}")
+        except anthropic.APIError as e:
+            raise Exception(f"Claude API error: {e}")
+        finally:
+            self._end_call()
+
+    def _reidentify_answer(self, text: str, session_id: str) -> str:
+        """Re-identify Claude's text, skipping the MedScrub call if it has no tokens"""
+        if not self._count_placeholders(text):
+            logger.debug("No placeholder tokens in response; skipping re-identification")
+            return text
+        return self.medscrub.reidentify_text_local(text=text, session_id=session_id)['reidentifiedText']
+
+    async def _areidentify_answer(self, text: str, session_id: str) -> str:
+        """Async version of _reidentify_answer"""
+        if not self._count_placeholders(text):
+            logger.debug("No placeholder tokens in response; skipping re-identification")
+            return text
+        result = await self.medscrub.areidentify_text(text=text, session_id=session_id)
+        return result['reidentifiedText']
+
+    @staticmethod
+    def _count_placeholders(text: str) -> int:
+        """Count the placeholder tokens (e.g. [FHIR_NAME_abc123]) in text"""
+        return len(_scan_placeholders(text))
+
+    @staticmethod
+    def _split_on_boundary(text: str) -> Tuple[str, str]:
+        """
+        Split text into (ready, pending) at the last safe token boundary
+
+        pending starts at the last "[" after the last complete placeholder when
+        the rest of the text could still become a token (e.g. "[FH" or
+        "[FHIR_NAME_ab"); other brackets, like "see [1", are passed through.
+        """
+        spans = _scan_placeholders(text)
+        last_end = spans[-1][1] if spans else 0
+
+        open_bracket = text.rfind("[", last_end)
+        if open_bracket != -1 and _PARTIAL_PLACEHOLDER_RE.fullmatch(text, open_bracket):
+            return text[:open_bracket], text[open_bracket:]
+        return text, ""
+
+    async def aask_about_fhir(
+        self,
+        resource: Dict[str, Any],
+        question: str,
+        session_id: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 1.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of ask_about_fhir
+
+        Returns the same dictionary as ask_about_fhir. Unlike ask_about_fhir it
+        always makes the three client-side calls: it does not use the fused
+        /api/fhir/ask endpoint or the de-identify LRU cache. The system prompt
+        is still marked for Anthropic prompt caching.
+
+        In Jupyter, await it directly. From a script, run all async work inside
+        one event loop, using the client as an async context manager.
+
+        Example:
+            async def main():
+                async with MedScrubClaude(...) as client:
+                    return await client.aask_about_fhir(
+                        resource=patient,
+                        question="What is this patient's diagnosis?"
+                    )
+
+            result = asyncio.run(main())
+        """
+        t0 = time.perf_counter_ns()
+        self._begin_call()
+        try:
+            # Step 1: De-identify FHIR resource
+            deidentify_result = await self.medscrub.adeidentify_fhir(
+                resource=resource,
+                session_id=session_id,
+                output_format="llm-optimized"
             )
 
-            # Extract Claude's response
-            deidentified_answer = message.content[0].text
+            session_id = deidentify_result['sessionId']
+            self._track_session(session_id)
+            deidentified_resource = deidentify_result['deidentifiedResource']
 
-            # Step 4: Re-identify Claude's response
-            reidentify_result = self.medscrub.reidentify_text(
-                text=deidentified_answer,
-                session_id=session_id
+            # Step 2: Call Claude API
+            message = await self.aclaude.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=self._system_blocks(system_prompt),
+                messages=[{
+                    "role": "user",
+                    "content": self._build_user_prompt(deidentified_resource, question)
+                }]
             )
 
-            original_answer = reidentify_result['reidentifiedText']
+            deidentified_answer = message.content[0].text
+
+            # Step 3: Re-identify Claude's response
+            original_answer = await self._areidentify_answer(deidentified_answer, session_id)
 
-            # Calculate total processing time
-            total_time = int((time.time() - start_time) * 1000)
+            total_time = (time.perf_counter_ns() - t0) // 1_000_000
 
             return {
                 "answer": original_answer,
@@ -197,6 +637,73 @@ Please answer the question based on the data provided. Use the exact tokens (e.g
             raise Exception(f"MedScrub error: {e}")
         except anthropic.APIError as e:
             raise Exception(f"Claude API error: {e}")
+        finally:
+            self._end_call()
+
+    async def abatch_ask_about_fhir(
+        self,
+        resources_and_questions: List[Tuple[Dict[str, Any], str]],
+        session_id: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 1.0,
+        system_prompt: Optional[str] = None,
+        max_concurrency: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Ask Claude many questions about FHIR data concurrently
+
+        Runs aask_about_fhir for every (resource, question) pair, with at most
+        max_concurrency requests in flight to stay within Anthropic rate limits.
+        All resources share one MedScrub session so cleanup() removes every
+        PHI mapping created by the batch.
+
+        Args:
+            resources_and_questions: List of (resource, question) pairs
+            session_id: Optional session ID (creates new if not provided)
+            max_tokens: Maximum tokens per response (default: 1024)
+            temperature: Sampling temperature 0-1 (default: 1.0)
+            system_prompt: Optional system prompt for Claude
+            max_concurrency: Maximum concurrent requests (default: 5)
+
+        Returns:
+            List of result dictionaries (same format as ask_about_fhir),
+            aligned with the input order
+
+        Example:
+            results = await client.abatch_ask_about_fhir([
+                (patient, "What is this patient's age?"),
+                (condition, "Summarize this condition"),
+            ])
+        """
+        items = list(resources_and_questions)
+        if not items:
+            return []
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(resource: Dict[str, Any], question: str, session_id: Optional[str]):
+            async with semaphore:
+                return await self.aask_about_fhir(
+                    resource=resource,
+                    question=question,
+                    session_id=session_id,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system_prompt=system_prompt
+                )
+
+        # The first item creates the session the rest of the batch joins
+        if not session_id:
+            first = await _one(*items[0], None)
+            session_id = first['sessionId']
+            items = items[1:]
+        else:
+            first = None
+
+        tasks = [_one(resource, question, session_id) for resource, question in items]
+        results = await asyncio.gather(*tasks)
+
+        return ([first] if first else []) + list(results)
 
     def analyze_fhir_bundle(
         self,
@@ -239,6 +746,182 @@ Please answer the question based on the data provided. Use the exact tokens (e.g
             max_tokens=max_tokens
         )
 
+    def batch_ask_about_fhir(
+        self,
+        resources_and_questions: List[Tuple[Dict[str, Any], str]],
+        session_id: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 1.0,
+        system_prompt: Optional[str] = None,
+        max_wait_ms: int = 24 * 60 * 60 * 1000
+    ) -> List[Dict[str, Any]]:
+        """
+        Ask Claude many questions about FHIR data using the Message Batches API
+
+        All resources are de-identified in one MedScrub call (one shared
+        session, see MedScrubClient.deidentify_fhir_batch), all prompts are
+        submitted as a single Anthropic message batch (50% token discount,
+        separate rate limit), and every answer is re-identified against that
+        shared session. Resources are sent to Claude as compact FHIR JSON,
+        since the llm-optimized rendering of a Bundle cannot be split per
+        resource. Falls back to one messages.create call per item
+        when the Batch API is unavailable.
+
+        Args:
+            resources_and_questions: List of (resource, question) pairs
+            session_id: Optional session ID (creates new if not provided)
+            max_tokens: Maximum tokens per response (default: 1024)
+            temperature: Sampling temperature 0-1 (default: 1.0)
+            system_prompt: Optional system prompt for Claude
+            max_wait_ms: Maximum time to wait for the batch to finish (default: 24h)
+
+        Returns:
+            List of result dictionaries aligned with the input order. Successful
+            items have the same keys as ask_about_fhir plus batchId; failed items
+            have answer=None and an error message.
+
+        Example:
+            results = client.batch_ask_about_fhir([
+                (patient, "What is this patient's age?"),
+                (condition, "Summarize this condition"),
+            ])
+
+            for result in results:
+                print(result['answer'])
+        """
+        t0 = time.perf_counter_ns()
+        self._begin_call()
+        try:
+            # Step 1: De-identify every resource in one MedScrub call (one shared session)
+            items = list(resources_and_questions)
+            deidentified = self.medscrub.deidentify_fhir_batch(
+                [resource for resource, _ in items],
+                session_id=session_id
+            )
+
+            batch_requests = []
+            for i, ((_, question), deidentify_result) in enumerate(zip(items, deidentified)):
+                batch_requests.append({
+                    "custom_id": f"item-{i}",
+                    "params": {
+                        "model": self.model,
+                        "max_tokens": max_tokens,
+                        "temperature": temperature,
+                        "system": self._system_blocks(system_prompt),
+                        "messages": [{
+                            "role": "user",
+                            "content": self._build_user_prompt(
+                                json.dumps(
+                                    deidentify_result['deidentifiedResource'],
+                                    separators=(",", ":")
+                                ),
+                                question
+                            )
+                        }]
+                    }
+                })
+
+            if not batch_requests:
+                return []
+            batch_session_id = deidentified[0]['sessionId']
+            self._track_session(batch_session_id)
+
+            # Step 2: Run all prompts through the Batch API
+            batch_id, messages = self._run_message_batch(batch_requests, max_wait_ms)
+
+            # Step 3: Re-identify each answer against the batch's session
+            total_time = (time.perf_counter_ns() - t0) // 1_000_000
+            results = []
+            for request in batch_requests:
+                message = messages.get(request["custom_id"])
+                if not isinstance(message, anthropic.types.Message):
+                    results.append({
+                        "answer": None,
+                        "sessionId": batch_session_id,
+                        "batchId": batch_id,
+                        "error": message or "No result returned for this request"
+                    })
+                    continue
+
+                deidentified_answer = message.content[0].text
+
+                results.append({
+                    "answer": self._reidentify_answer(deidentified_answer, batch_session_id),
+                    "deidentifiedAnswer": deidentified_answer,
+                    "sessionId": batch_session_id,
+                    "batchId": batch_id,
+                    "usage": {
+                        "inputTokens": message.usage.input_tokens,
+                        "outputTokens": message.usage.output_tokens,
+                        "totalTokens": message.usage.input_tokens + message.usage.output_tokens
+                    },
+                    "processingTime": total_time,
+                    "model": self.model
+                })
+
+            return results
+
+        except MedScrubError as e:
+            raise Exception(f"MedScrub error: {e}")
+        except (anthropic.APIError, TimeoutError) as e:
+            raise Exception(f"Claude API error: {e}")
+        finally:
+            self._end_call()
+
+    def _run_message_batch(
+        self,
+        batch_requests: List[Dict[str, Any]],
+        max_wait_ms: int
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Submit a message batch, poll until it ends, and collect its results
+
+        Falls back to one messages.create call per request, with batch ID None,
+        only when the Batch API itself is unavailable: an SDK without
+        messages.batches, or a create call rejected with 404/403. Errors after
+        the batch was accepted are raised, never retried at full price.
+
+        Returns:
+            Tuple of (batch ID, {custom_id: Message or error string})
+        """
+        batches = getattr(self.claude.messages, "batches", None)
+        batch = None
+        if batches is not None:
+            try:
+                batch = batches.create(requests=batch_requests)
+            except (anthropic.NotFoundError, anthropic.PermissionDeniedError):
+                batch = None
+
+        if batch is None:
+            return None, {
+                request["custom_id"]: self.claude.messages.create(**request["params"])
+                for request in batch_requests
+            }
+
+        # Poll with exponential backoff (5s -> 60s) until processing has ended
+        deadline = time.monotonic() + max_wait_ms / 1000
+        delay = 5
+        while batch.processing_status != "ended":
+            if time.monotonic() >= deadline:
+                batches.cancel(batch.id)
+                raise TimeoutError(
+                    f"Message batch {batch.id} did not finish within {max_wait_ms}ms"
+                )
+            time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+            delay = min(delay * 2, 60)
+            batch = batches.retrieve(batch.id)
+
+        messages = {}
+        for entry in batches.results(batch.id):
+            if entry.result.type == "succeeded":
+                messages[entry.custom_id] = entry.result.message
+            elif entry.result.type == "errored":
+                messages[entry.custom_id] = f"Claude API error: {entry.result.error.error.message}"
+            else:
+                messages[entry.custom_id] = f"Request {entry.result.type}"
+
+        return batch.id, messages
+
     def chat_about_fhir(
         self,
         resource: Dict[str, Any],
@@ -271,69 +954,183 @@ Please answer the question based on the data provided. Use the exact tokens (e.g
                 session_id=session_id  # Use same session for context
             )
         """
-        import time
-        start_time = time.time()
+        t0 = time.perf_counter_ns()
 
-        # De-identify resource once
-        deidentify_result = self.medscrub.deidentify_fhir(
-            resource=resource,
-            session_id=session_id,
-            output_format="llm-optimized"
-        )
+        self._begin_call()
+        try:
+            # De-identify resource once per conversation, not once per turn
+            deidentified_resource, session_id = self._deidentify_for_chat(resource, session_id)
+            self._track_session(session_id)
+
+            # Prepend resource context to first user message as a cached block,
+            # so later turns about the same resource reuse the cached prefix
+            enriched_messages = []
+            for i, msg in enumerate(messages):
+                if i == 0 and msg['role'] == 'user':
+                    enriched_content = [
+                        {
+                            "type": "text",
+                            "text": "".join((_CHAT_CONTEXT_PRE, deidentified_resource)),
+                            "cache_control": {"type": "ephemeral"}
+                        },
+                        {"type": "text", "text": msg['content']}
+                    ]
+                    enriched_messages.append({
+                        "role": "user",
+                        "content": enriched_content
+                    })
+                else:
+                    enriched_messages.append(msg)
+
+            # Call Claude with conversation history
+            message = self.claude.messages.create(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=enriched_messages
+            )
 
-        session_id = deidentify_result['sessionId']
-        self._current_session_id = session_id
-        deidentified_resource = deidentify_result['deidentifiedResource']
+            deidentified_answer = message.content[0].text
 
-        # Prepend resource context to first user message
-        enriched_messages = []
-        for i, msg in enumerate(messages):
-            if i == 0 and msg['role'] == 'user':
-                enriched_content = f"""Patient data:
-{deidentified_resource}
+            # Re-identify response
+            original_answer = self._reidentify_answer(deidentified_answer, session_id)
 
-{msg['content']}"""
-                enriched_messages.append({
-                    "role": "user",
-                    "content": enriched_content
-                })
-            else:
-                enriched_messages.append(msg)
+            total_time = (time.perf_counter_ns() - t0) // 1_000_000
 
-        # Call Claude with conversation history
-        message = self.claude.messages.create(
-            model=self.model,
-            max_tokens=max_tokens,
-            messages=enriched_messages
-        )
+            return {
+                "answer": original_answer,
+                "deidentifiedAnswer": deidentified_answer,
+                "sessionId": session_id,
+                "usage": {
+                    "inputTokens": message.usage.input_tokens,
+                    "outputTokens": message.usage.output_tokens,
+                    "totalTokens": message.usage.input_tokens + message.usage.output_tokens
+                },
+                "processingTime": total_time
+            }
+        finally:
+            self._end_call()
+
+    def _deidentify_for_chat(
+        self,
+        resource: Dict[str, Any],
+        session_id: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        De-identify a chat resource, reusing the rendering from earlier turns
 
-        deidentified_answer = message.content[0].text
+        Returns:
+            Tuple of (deidentified_resource, session_id)
+        """
+        # Encode once per turn: the bytes serve as both fingerprint input and request body
+        encoded = self.medscrub.encode_resource(resource)
+        fp = hashlib.blake2b(encoded, digest_size=16).digest()
+
+        # Without a session ID every chat starts a new session, so there is nothing to reuse
+        with self._lock:
+            cached = self._deid_cache.get((session_id, fp)) if session_id else None
+            if cached is not None:
+                self._deid_cache.move_to_end((session_id, fp))
+        if cached is not None:
+            logger.debug("Reusing de-identified resource for session %s", cached[1])
+            return cached
 
-        # Re-identify response
-        reidentify_result = self.medscrub.reidentify_text(
-            text=deidentified_answer,
-            session_id=session_id
+        deidentify_result = self.medscrub.deidentify_fhir(
+            resource=encoded,
+            session_id=session_id,
+            output_format="llm-optimized"
         )
+        entry = (deidentify_result['deidentifiedResource'], deidentify_result['sessionId'])
 
-        total_time = int((time.time() - start_time) * 1000)
+        # Keyed by the returned session ID: follow-up turns pass it back in
+        key = (entry[1], fp)
+        with self._lock:
+            self._deid_cache[key] = entry
+            self._deid_cache.move_to_end(key)
+            while len(self._deid_cache) > _CHAT_DEID_CACHE_SIZE:
+                self._deid_cache.popitem(last=False)
 
-        return {
-            "answer": reidentify_result['reidentifiedText'],
-            "deidentifiedAnswer": deidentified_answer,
-            "sessionId": session_id,
-            "usage": {
-                "inputTokens": message.usage.input_tokens,
-                "outputTokens": message.usage.output_tokens,
-                "totalTokens": message.usage.input_tokens + message.usage.output_tokens
-            },
-            "processingTime": total_time
-        }
+        return entry
+
+    def _track_session(self, session_id: str):
+        """Record a session for cleanup"""
+        with self._lock:
+            self._current_session_id = session_id
+            self._pending_session_ids.add(session_id)
+        _live_clients.add(self)
+
+    def _begin_call(self):
+        """Pause the idle timer while an ask/chat call is in progress"""
+        with self._lock:
+            self._active_calls += 1
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+
+    def _end_call(self):
+        """Restart the idle timer once the last in-progress call has finished"""
+        with self._lock:
+            self._active_calls -= 1
+            if self.max_idle_seconds is None or self._active_calls:
+                return
+            self._idle_timer = threading.Timer(self.max_idle_seconds, self._idle_cleanup)
+            self._idle_timer.daemon = True
+            self._idle_timer.start()
+
+    def _idle_cleanup(self):
+        """Idle timer callback: delete sessions and drop cached PHI, keep connections open"""
+        with self._lock:
+            if self._active_calls:
+                return  # a call started just as the timer fired
+            self._idle_timer = None
+        try:
+            self.flush_sessions()
+        except Exception as e:
+            # Sessions stay pending and are retried by the next flush
+            logger.warning("Could not delete idle MedScrub sessions: %s", e)
+        self.medscrub.clear_deid_cache()
+
+    def flush_sessions(self):
+        """Delete every session this client has created, in one bulk call
+
+        Sessions stay pending if the delete fails, so a later flush retries them.
+        """
+        with self._lock:
+            session_ids = set(self._pending_session_ids)
+
+        if len(session_ids) == 1:
+            try:
+                self.medscrub.delete_session(next(iter(session_ids)))
+            except MedScrubNotFoundError:
+                pass  # already expired server-side
+        elif session_ids:
+            self.medscrub.delete_sessions_bulk(sorted(session_ids))
+
+        with self._lock:
+            self._pending_session_ids -= session_ids
+            if self._current_session_id in session_ids:
+                self._current_session_id = None
+            self._evict_chat_sessions(session_ids)
+            if not self._pending_session_ids:
+                _live_clients.discard(self)
+
+    def _evict_chat_sessions(self, session_ids: Set[str]):
+        """Drop cached chat renderings of deleted sessions"""
+        for key in [key for key in self._deid_cache if key[0] in session_ids]:
+            del self._deid_cache[key]
 
     def cleanup(self):
-        """Delete current session and clear PHI mappings"""
-        if self._current_session_id:
-            self.medscrub.delete_session(self._current_session_id)
-            self._current_session_id = None
+        """Delete all sessions, clear PHI mappings, and close pooled connections"""
+        with self._lock:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+        try:
+            self.flush_sessions()
+        finally:
+            with self._lock:
+                self._deid_cache.clear()
+            self.medscrub.clear_deid_cache()
+            self.medscrub.close()
 
     def __enter__(self):
         """Context manager support for automatic cleanup"""
@@ -343,12 +1140,22 @@ Please answer the question based on the data provided. Use the exact tokens (e.g
         """Automatic cleanup on context manager exit"""
         self.cleanup()
 
+    async def __aenter__(self):
+        """Async context manager support for automatic cleanup"""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Automatic cleanup and async client shutdown on exit"""
+        self.cleanup()
+        await self.medscrub.aclose()
+        if self._aclaude is not None and self._aclaude_loop is asyncio.get_running_loop():
+            await self._aclaude.close()
+        self._aclaude = None
+        self._aclaude_loop = None
+
 
 # Example usage
 if __name__ == "__main__":
-    import json
-    import os
-
     # Get credentials from environment
     medscrub_jwt = os.getenv("MEDSCRUB_JWT_TOKEN")
     claude_api_key = os.getenv("ANTHROPIC_API_KEY")
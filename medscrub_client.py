@@ -15,15 +15,72 @@ Usage:
     original = client.reidentify_fhir(result['deidentifiedResource'], result['sessionId'])
 """
 
+import sys
 import requests
+import httpx
 import json
-from typing import Dict, Any, Optional
+import asyncio
+import copy
+import gzip
+import hashlib
+import threading
+import time
+import uuid
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+from typing import Dict, Any, Optional, List, Mapping, Tuple, Union
+from collections import OrderedDict
 from dataclasses import dataclass
+from datetime import datetime, timezone
 
+# orjson is optional: much faster (de)serialization of large FHIR Bundles
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# msgpack is optional: compact binary responses for llm-optimized de-identification
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_MSGPACK_CONTENT_TYPE = "application/x-msgpack"
+
+# De-identify cache bounds; the TTL is kept well below the server's session lifetime
+_DEID_CACHE_SIZE = 256
+_DEID_CACHE_TTL_SECONDS = 15 * 60
+
+# Request bodies above this size are gzip-compressed; smaller ones aren't worth the CPU
+_GZIP_MIN_BYTES = 4096
+
+# pyahocorasick is optional: local single-pass re-identification (reidentify_text_local)
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# slots=True needs Python 3.10+; older interpreters get a plain frozen dataclass
+@dataclass(frozen=True, **({"slots": True} if sys.version_info >= (3, 10) else {}))
 class MedScrubConfig:
-    """Configuration for MedScrub API client"""
+    """Configuration for MedScrub API client (immutable once the client is built)"""
     api_url: str = "https://api.medscrub.dev"
     jwt_token: Optional[str] = None
     api_key: Optional[str] = None
@@ -32,16 +89,28 @@ class MedScrubConfig:
 
 class MedScrubError(Exception):
     """Base exception for MedScrub API errors"""
-    pass
+    __slots__ = ()
 
 
 class MedScrubAuthError(MedScrubError):
     """Authentication error (401)"""
-    pass
+    __slots__ = ()
+
+
+class MedScrubForbiddenError(MedScrubError):
+    """Credentials not permitted to perform the request (403)"""
+    __slots__ = ()
+
+
+class MedScrubNotFoundError(MedScrubError):
+    """Resource or endpoint not found (404)"""
+    __slots__ = ()
 
 
 class MedScrubRateLimitError(MedScrubError):
     """Rate limit exceeded (429)"""
+    __slots__ = ("retry_after",)
+
     def __init__(self, message: str, retry_after: Optional[int] = None):
         super().__init__(message)
         self.retry_after = retry_after
@@ -78,25 +147,121 @@ class MedScrubClient:
         if not jwt_token and not api_key:
             raise ValueError("Either jwt_token or api_key must be provided")
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Build request headers with authentication"""
-        headers = {
+        # Headers never change after init: build once, read-only so callers can't mutate them
+        self._headers = MappingProxyType({
             "Content-Type": "application/json",
-            "User-Agent": "MedScrub-Python-Client/1.0"
-        }
-
-        if self.config.jwt_token:
-            headers["Authorization"] = f"Bearer {self.config.jwt_token}"
-        elif self.config.api_key:
-            headers["X-API-Key"] = self.config.api_key
-
-        return headers
-
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+            "User-Agent": "MedScrub-Python-Client/1.0",
+            # Every encoding urllib3 can decode here (br/zstd only if their packages are installed)
+            "Accept-Encoding": ACCEPT_ENCODING,
+            **({"Authorization": f"Bearer {jwt_token}"} if jwt_token else {"X-API-Key": api_key})
+        })
+
+        # httpx only decodes zstd from 0.27.1, so the async client never advertises it
+        self._aheaders = MappingProxyType({
+            **self._headers,
+            "Accept-Encoding": ",".join(
+                enc for enc in ACCEPT_ENCODING.split(",") if enc.strip() != "zstd"
+            )
+        })
+
+        # Gzip large request bodies until the server rejects one (415)
+        self._gzip_accepted = True
+
+        # Offer msgpack for llm-optimized responses until the server refuses it (406)
+        self._msgpack_accepted = msgpack is not None
+        self._msgpack_headers = MappingProxyType({
+            **self._headers,
+            "Accept": f"{_MSGPACK_CONTENT_TYPE}, application/json;q=0.9"
+        })
+
+        # Persistent session: pooled keep-alive connections + retries on gateway errors
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+                # Hand the final 5xx to _handle_response (-> MedScrubError), not RetryError
+                raise_on_status=False
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Per-instance memo of identical de-identify calls (see deidentify_fhir)
+        # key -> (monotonic expiry, response), in LRU order; guarded by _deid_lock
+        self._deid_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._deid_lock = threading.Lock()
+
+        # session_id -> Aho-Corasick automaton over that session's token mappings
+        self._session_automata: Dict[str, Any] = {}
+        self._local_mappings_available = ahocorasick is not None
+
+        # Async HTTP client for the a* methods, bound to the event loop it was created on
+        self._aclient: Optional[httpx.AsyncClient] = None
+        self._aclient_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_aclient(self) -> httpx.AsyncClient:
+        """Return the async HTTP client for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            # Pooled connections can't outlive their loop (e.g. across asyncio.run calls)
+            self._aclient = httpx.AsyncClient(timeout=self.config.timeout)
+            self._aclient_loop = loop
+        return self._aclient
+
+    def _compress_body(self, body: bytes, headers: Mapping[str, str]) -> Tuple[bytes, Mapping[str, str]]:
+        """Gzip large request bodies, adding the matching Content-Encoding header"""
+        if not self._gzip_accepted or len(body) <= _GZIP_MIN_BYTES:
+            return body, headers
+        return gzip.compress(body, compresslevel=6), {**headers, "Content-Encoding": "gzip"}
+
+    def _post(self, url: str, body: bytes, headers: Mapping[str, str]) -> requests.Response:
+        """POST a body, gzipped when large; resend it uncompressed if the server rejects gzip"""
+        data, send_headers = self._compress_body(body, headers)
+        response = self._session.post(
+            url,
+            headers=send_headers,
+            data=data,
+            timeout=self.config.timeout
+        )
+        if data is not body and response.status_code == 415:
+            # Server does not accept gzip request bodies - send them plain from now on
+            self._gzip_accepted = False
+            response = self._session.post(
+                url,
+                headers=headers,
+                data=body,
+                timeout=self.config.timeout
+            )
+        return response
+
+    async def _apost(self, url: str, body: bytes, headers: Mapping[str, str]) -> httpx.Response:
+        """Async version of _post"""
+        data, send_headers = self._compress_body(body, headers)
+        response = await self._get_aclient().post(url, headers=send_headers, content=data)
+        if data is not body and response.status_code == 415:
+            self._gzip_accepted = False
+            response = await self._get_aclient().post(url, headers=headers, content=body)
+        return response
+
+    @staticmethod
+    def _error_data(response: Union[requests.Response, httpx.Response]) -> Dict[str, Any]:
+        """Parse an error body, tolerating empty or non-JSON ones (e.g. gateway HTML pages)"""
+        try:
+            error_data = _json_loads(response.content) if response.content else {}
+        except ValueError:
+            return {}
+        return error_data if isinstance(error_data, dict) else {}
+
+    def _handle_response(self, response: Union[requests.Response, httpx.Response]) -> Dict[str, Any]:
         """Handle API response and raise appropriate exceptions"""
         if response.status_code == 401:
             raise MedScrubAuthError(
-                f"Authentication failed: {response.json().get('message', 'Invalid credentials')}"
+                f"Authentication failed: {self._error_data(response).get('message', 'Invalid credentials')}"
             )
 
         if response.status_code == 429:
@@ -106,17 +271,32 @@ class MedScrubClient:
                 retry_after=int(retry_after) if retry_after else None
             )
 
+        if response.status_code == 403:
+            error_data = self._error_data(response)
+            raise MedScrubForbiddenError(
+                f"Forbidden: {error_data.get('message', 'Insufficient permissions')}"
+            )
+
+        if response.status_code == 404:
+            error_data = self._error_data(response)
+            raise MedScrubNotFoundError(
+                f"Not found: {error_data.get('message', response.url)}"
+            )
+
         if response.status_code >= 400:
-            error_data = response.json() if response.content else {}
+            error_data = self._error_data(response)
             raise MedScrubError(
                 f"API error ({response.status_code}): {error_data.get('message', 'Unknown error')}"
             )
 
-        return response.json()
+        if msgpack is not None and response.headers.get('Content-Type', '').startswith(_MSGPACK_CONTENT_TYPE):
+            return msgpack.unpackb(response.content, raw=False)
+
+        return _json_loads(response.content)
 
     def deidentify_fhir(
         self,
-        resource: Dict[str, Any],
+        resource: Union[Dict[str, Any], bytes],
         session_id: Optional[str] = None,
         output_format: str = "json"
     ) -> Dict[str, Any]:
@@ -124,10 +304,15 @@ class MedScrubClient:
         De-identify a FHIR resource or Bundle
 
         Args:
-            resource: FHIR resource (Patient, Observation, etc.) or Bundle
+            resource: FHIR resource (Patient, Observation, etc.) or Bundle, or
+                its encoding from encode_resource() to skip re-encoding
             session_id: Optional session ID for continued de-identification
             output_format: Output format - "json" (default), "json-compact", "python-dict", or "llm-optimized"
 
+        Identical calls (same resource, session_id and output_format) are served
+        from an in-process LRU cache for up to 15 minutes, or until the session
+        expires if sooner; see clear_deid_cache().
+
         Returns:
             Dictionary containing:
                 - deidentifiedResource: De-identified FHIR resource (format depends on output_format)
@@ -152,24 +337,161 @@ class MedScrubClient:
             result = client.deidentify_fhir(patient, output_format="python-dict")
             print(result['deidentifiedResource'])  # Copy/paste ready Python dict
         """
-        url = f"{self.config.api_url}/api/fhir/deidentify"
+        if not isinstance(resource, bytes):
+            resource = self.encode_resource(resource)
+
+        # Repeat questions about the same resource hit the cache, not the network.
+        # Keyed by a digest so the cache never holds raw PHI payloads
+        key = (session_id, output_format, hashlib.blake2b(resource, digest_size=16).digest())
+        with self._deid_lock:
+            entry = self._deid_cache.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._deid_cache.move_to_end(key)
+                    return copy.deepcopy(entry[1])
+                del self._deid_cache[key]
+
+        result = self._deidentify_fhir_request(session_id, resource, output_format)
+
+        with self._deid_lock:
+            self._deid_cache[key] = (self._deid_cache_expiry(result), result)
+            self._deid_cache.move_to_end(key)
+            while len(self._deid_cache) > _DEID_CACHE_SIZE:
+                self._deid_cache.popitem(last=False)
+
+        # Deep copy: "json" results are nested dicts callers may modify
+        return copy.deepcopy(result)
+
+    @staticmethod
+    def _deid_cache_expiry(result: Dict[str, Any]) -> float:
+        """Monotonic time a cached de-identify result stops being reused"""
+        ttl = _DEID_CACHE_TTL_SECONDS
+
+        # Never outlive the session itself, when the server says when it expires
+        expires_at = result.get('expiresAt')
+        if isinstance(expires_at, str):
+            try:
+                expires = datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+                if expires.tzinfo is None:
+                    expires = expires.replace(tzinfo=timezone.utc)
+            except ValueError:
+                pass
+            else:
+                ttl = min(ttl, (expires - datetime.now(timezone.utc)).total_seconds())
+
+        return time.monotonic() + ttl
+
+    @staticmethod
+    def encode_resource(resource: Dict[str, Any]) -> bytes:
+        """
+        Compact JSON encoding of a FHIR resource, keys in the caller's order
 
-        payload = {
-            "resource": resource,
-            "outputFormat": output_format
+        Encode once and pass the bytes to deidentify_fhir() to avoid walking
+        the same resource twice, e.g. when also fingerprinting it.
+        """
+        return _json_dumps(resource)
+
+    def deidentify_fhir_batch(
+        self,
+        resources: List[Dict[str, Any]],
+        session_id: Optional[str] = None,
+        output_format: str = "json"
+    ) -> List[Dict[str, Any]]:
+        """
+        De-identify many FHIR resources in a single API call
+
+        The resources are wrapped in a transient collection Bundle, so N
+        resources cost one round trip instead of N. All of them share one
+        session.
+
+        Args:
+            resources: FHIR resources to de-identify
+            session_id: Optional session ID for continued de-identification
+            output_format: "json" (default) or "json-compact"; formats that
+                render the Bundle as a single string cannot be split per resource
+
+        Returns:
+            List aligned with resources, each containing:
+                - deidentifiedResource: De-identified FHIR resource
+                - sessionId: Session ID for re-identification
+
+        Example:
+            results = client.deidentify_fhir_batch([patient, condition, observation])
+            print(results[0]['deidentifiedResource'])
+        """
+        if not resources:
+            return []
+
+        # fullUrl correlates each returned entry with its input position
+        full_urls = [f"urn:uuid:{uuid.uuid4()}" for _ in resources]
+        bundle = {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"fullUrl": full_url, "resource": resource}
+                for full_url, resource in zip(full_urls, resources)
+            ]
         }
+
+        # Fresh fullUrls make every batch unique, so bypass the deidentify_fhir cache
+        result = self._deidentify_fhir_request(session_id, self.encode_resource(bundle), output_format)
+        deidentified_bundle = result['deidentifiedResource']
+        if not isinstance(deidentified_bundle, dict):
+            raise MedScrubError(
+                f"Output format '{output_format}' cannot be split into per-resource results"
+            )
+
+        entries = deidentified_bundle.get('entry', [])
+        by_url = {entry.get('fullUrl'): entry.get('resource') for entry in entries}
+        if not all(full_url in by_url for full_url in full_urls):
+            # fullUrls were rewritten server-side - fall back to entry order
+            by_url = {full_url: entry.get('resource') for full_url, entry in zip(full_urls, entries)}
+
+        return [
+            {
+                "deidentifiedResource": by_url.get(full_url),
+                "sessionId": result['sessionId']
+            }
+            for full_url in full_urls
+        ]
+
+    def _deidentify_fhir_request(
+        self,
+        session_id: Optional[str],
+        resource: bytes,
+        output_format: str
+    ) -> Dict[str, Any]:
+        """POST an encoded resource for de-identification, without caching"""
+        url = f"{self.config.api_url}/api/fhir/deidentify"
+
+        # Splice the pre-encoded resource into the payload instead of re-encoding it
+        parts = [b'{"resource":', resource, b',"outputFormat":', _json_dumps(output_format)]
         if session_id:
-            payload["sessionId"] = session_id
+            parts += [b',"sessionId":', _json_dumps(session_id)]
+        parts.append(b"}")
+        body = b"".join(parts)
 
-        response = requests.post(
-            url,
-            headers=self._get_headers(),
-            json=payload,
-            timeout=self.config.timeout
-        )
+        # New tokens may be added to the session, so its local automaton is stale
+        self._session_automata.pop(session_id, None)
+
+        if output_format == "llm-optimized" and self._msgpack_accepted:
+            response = self._post(url, body, self._msgpack_headers)
+            if response.status_code != 406:
+                return self._handle_response(response)
+
+            # Server does not speak msgpack - use JSON from now on
+            self._msgpack_accepted = False
+
+        response = self._post(url, body, self._headers)
 
         return self._handle_response(response)
 
+    def clear_deid_cache(self):
+        """Drop all cached de-identify responses and local token mappings (PHI)"""
+        with self._deid_lock:
+            self._deid_cache.clear()
+        self._session_automata.clear()
+
     def reidentify_fhir(
         self,
         resource: Dict[str, Any],
@@ -197,13 +519,13 @@ class MedScrubClient:
         """
         url = f"{self.config.api_url}/api/fhir/reidentify"
 
-        response = requests.post(
+        response = self._session.post(
             url,
-            headers=self._get_headers(),
-            json={
+            headers=self._headers,
+            data=_json_dumps({
                 "resource": resource,
                 "sessionId": session_id
-            },
+            }),
             timeout=self.config.timeout
         )
 
@@ -226,9 +548,9 @@ class MedScrubClient:
         """
         url = f"{self.config.api_url}/api/session"
 
-        response = requests.get(
+        response = self._session.get(
             url,
-            headers=self._get_headers(),
+            headers=self._headers,
             params={"sessionId": session_id},
             timeout=self.config.timeout
         )
@@ -245,17 +567,59 @@ class MedScrubClient:
         Returns:
             Dictionary with deletion confirmation
         """
+        # Cached de-identify results may point at the deleted session
+        self.clear_deid_cache()
+
         url = f"{self.config.api_url}/api/session"
 
-        response = requests.delete(
+        response = self._session.delete(
             url,
-            headers=self._get_headers(),
+            headers=self._headers,
             params={"sessionId": session_id},
             timeout=self.config.timeout
         )
 
         return self._handle_response(response)
 
+    def delete_sessions_bulk(self, session_ids: List[str]) -> Dict[str, Any]:
+        """
+        Delete several de-identification sessions in a single API call
+
+        Falls back to one delete_session call per ID if the server has no
+        bulk endpoint (404).
+
+        Args:
+            session_ids: Session IDs to delete
+
+        Returns:
+            Dictionary with deletion confirmation
+        """
+        session_ids = list(session_ids)
+        if not session_ids:
+            return {"sessionIds": []}
+
+        # Cached de-identify results may point at the deleted sessions
+        self.clear_deid_cache()
+
+        url = f"{self.config.api_url}/api/session/bulk"
+
+        response = self._session.delete(
+            url,
+            headers=self._headers,
+            data=_json_dumps({"sessionIds": session_ids}),
+            timeout=self.config.timeout
+        )
+
+        try:
+            return self._handle_response(response)
+        except MedScrubNotFoundError:
+            for session_id in session_ids:
+                try:
+                    self.delete_session(session_id)
+                except MedScrubNotFoundError:
+                    pass  # already expired server-side
+            return {"sessionIds": session_ids}
+
     def deidentify_text(
         self,
         text: str,
@@ -278,6 +642,7 @@ class MedScrubClient:
                 - processingTime: Processing time in milliseconds
         """
         url = f"{self.config.api_url}/api/deidentify"
+        self._session_automata.pop(session_id, None)
 
         payload = {
             "text": text,
@@ -286,10 +651,10 @@ class MedScrubClient:
         if session_id:
             payload["sessionId"] = session_id
 
-        response = requests.post(
+        response = self._session.post(
             url,
-            headers=self._get_headers(),
-            json=payload,
+            headers=self._headers,
+            data=_json_dumps(payload),
             timeout=self.config.timeout
         )
 
@@ -315,18 +680,234 @@ class MedScrubClient:
         """
         url = f"{self.config.api_url}/api/reidentify"
 
-        response = requests.post(
+        response = self._session.post(
             url,
-            headers=self._get_headers(),
-            json={
+            headers=self._headers,
+            data=_json_dumps({
                 "text": text,
                 "sessionId": session_id
-            },
+            }),
             timeout=self.config.timeout
         )
 
         return self._handle_response(response)
 
+    def ask_llm(
+        self,
+        resource: Dict[str, Any],
+        prompt: str,
+        model: str,
+        session_id: Optional[str] = None,
+        max_tokens: int = 1024,
+        temperature: float = 1.0,
+        system_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        De-identify, ask an LLM, and re-identify in a single server-side call
+
+        Requires a MedScrub deployment that advertises the "fhir/ask" feature
+        in health_check(); older deployments raise MedScrubNotFoundError.
+
+        Args:
+            resource: FHIR resource (Patient, Observation, etc.) or Bundle
+            prompt: Question to ask about the data
+            model: Claude model to use
+            session_id: Optional session ID for continued de-identification
+            max_tokens: Maximum tokens in response (default: 1024)
+            temperature: Sampling temperature 0-1 (default: 1.0)
+            system_prompt: Optional system prompt
+
+        Returns:
+            Dictionary containing:
+                - answer: LLM response with original PHI restored
+                - deidentifiedAnswer: LLM response with tokens
+                - sessionId: Session ID for this interaction
+                - usage: Token usage stats (inputTokens, outputTokens)
+                - processingTime: Processing time in milliseconds
+        """
+        url = f"{self.config.api_url}/api/fhir/ask"
+
+        # The server may add tokens to the session, so its local automaton is stale
+        self._session_automata.pop(session_id, None)
+
+        payload = {
+            "resource": resource,
+            "prompt": prompt,
+            "model": model,
+            "maxTokens": max_tokens,
+            "temperature": temperature
+        }
+        if session_id:
+            payload["sessionId"] = session_id
+        if system_prompt:
+            payload["systemPrompt"] = system_prompt
+
+        response = self._post(url, _json_dumps(payload), self._headers)
+
+        result = self._handle_response(response)
+        self._session_automata.pop(result.get('sessionId'), None)
+        return result
+
+    async def adeidentify_fhir(
+        self,
+        resource: Dict[str, Any],
+        session_id: Optional[str] = None,
+        output_format: str = "json"
+    ) -> Dict[str, Any]:
+        """
+        Async version of deidentify_fhir
+
+        Example:
+            result = await client.adeidentify_fhir(patient, output_format="llm-optimized")
+        """
+        url = f"{self.config.api_url}/api/fhir/deidentify"
+        self._session_automata.pop(session_id, None)
+
+        payload = {
+            "resource": resource,
+            "outputFormat": output_format
+        }
+        if session_id:
+            payload["sessionId"] = session_id
+
+        response = await self._apost(url, _json_dumps(payload), self._aheaders)
+
+        return self._handle_response(response)
+
+    async def areidentify_text(
+        self,
+        text: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """
+        Async version of reidentify_text
+
+        Example:
+            result = await client.areidentify_text(deidentified_text, session_id)
+        """
+        url = f"{self.config.api_url}/api/reidentify"
+
+        response = await self._get_aclient().post(
+            url,
+            headers=self._aheaders,
+            content=_json_dumps({
+                "text": text,
+                "sessionId": session_id
+            })
+        )
+
+        return self._handle_response(response)
+
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self._session.close()
+
+    async def aclose(self):
+        """Close the async HTTP client and its pooled connections"""
+        if self._aclient is not None and self._aclient_loop is asyncio.get_running_loop():
+            await self._aclient.aclose()
+        self._aclient = None
+        self._aclient_loop = None
+
+    def get_session_mappings(self, session_id: str) -> Dict[str, str]:
+        """
+        Get the token -> original value mappings of a session
+
+        Only available to credentials authorized to read PHI mappings.
+
+        Args:
+            session_id: Session ID to query
+
+        Returns:
+            Dictionary mapping placeholder tokens (e.g. [FHIR_NAME_abc123]) to
+            the original values
+        """
+        url = f"{self.config.api_url}/api/session/{session_id}/mappings"
+
+        response = self._session.get(
+            url,
+            headers=self._headers,
+            timeout=self.config.timeout
+        )
+
+        return self._handle_response(response).get('mappings', {})
+
+    def _session_exists(self, session_id: str) -> bool:
+        """Check whether a session is still alive (False only on a 404)"""
+        try:
+            self.get_session_info(session_id)
+        except MedScrubNotFoundError:
+            return False
+        return True
+
+    def reidentify_text_local(
+        self,
+        text: str,
+        session_id: str
+    ) -> Dict[str, Any]:
+        """
+        Re-identify text client-side in a single Aho-Corasick pass
+
+        The session's mappings are fetched once and compiled into an automaton,
+        so later calls need no network round trip. Falls back to
+        reidentify_text() when pyahocorasick is not installed or the
+        credentials may not read session mappings.
+
+        Args:
+            text: De-identified text
+            session_id: Session ID from de-identification
+
+        Returns:
+            Dictionary containing:
+                - reidentifiedText: Original text restored
+                - sessionId: Session ID used
+        """
+        automaton = self._session_automata.get(session_id)
+        if automaton is None and self._local_mappings_available:
+            try:
+                mappings = self.get_session_mappings(session_id)
+            except (MedScrubAuthError, MedScrubForbiddenError):
+                # Mappings not exposed to these credentials - stop trying
+                self._local_mappings_available = False
+            except MedScrubNotFoundError:
+                # A live session without mappings means the route itself is missing;
+                # an expired one only affects this call
+                try:
+                    route_missing = self._session_exists(session_id)
+                except MedScrubError:
+                    route_missing = False
+                if route_missing:
+                    self._local_mappings_available = False
+            except MedScrubError:
+                pass  # transient failure - use the server for this call only
+            else:
+                automaton = ahocorasick.Automaton()
+                for token, original in mappings.items():
+                    automaton.add_word(token, (len(token), original))
+                if mappings:
+                    automaton.make_automaton()
+                self._session_automata[session_id] = automaton
+
+        if automaton is None:
+            return self.reidentify_text(text, session_id)
+
+        parts = []
+        pos = 0
+        if len(automaton):
+            for end, (length, original) in automaton.iter(text):
+                start = end - length + 1
+                if start < pos:
+                    continue  # overlaps a token already replaced
+                parts.append(text[pos:start])
+                parts.append(original)
+                pos = end + 1
+        parts.append(text[pos:])
+
+        return {
+            "reidentifiedText": "".join(parts),
+            "sessionId": session_id
+        }
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check API health status
@@ -336,7 +917,7 @@ class MedScrubClient:
         """
         url = f"{self.config.api_url}/health"
 
-        response = requests.get(url, timeout=self.config.timeout)
+        response = self._session.get(url, timeout=self.config.timeout)
         return self._handle_response(response)
 
 